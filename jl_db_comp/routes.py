@@ -1,6 +1,13 @@
+import atexit
+import gzip
+import hashlib
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote
 
+from cachetools import TTLCache
 from jupyter_server.base.handlers import APIHandler
 from jupyter_server.utils import url_path_join
 import tornado
@@ -13,16 +20,367 @@ from .connections import (
 
 try:
     import psycopg2
+    import psycopg2.extensions
+    import psycopg2.pool
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a response payload to JSON bytes.
+
+    Uses orjson when available - it serializes in C and returns bytes
+    directly, skipping the separate UTF-8 encode step - and falls back
+    to the stdlib encoder otherwise.
+
+    Args:
+        obj: JSON-serializable payload
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+if PSYCOPG2_AVAILABLE:
+    class _CompletionsConnection(psycopg2.extensions.connection):
+        """Pooled connection that remembers whether the hot completion
+        statements have been prepared on it."""
+
+        prepared = False
+
+
+# Hot-path SQL, named at module scope so each statement is built once and
+# the queries the handlers depend on are visible in one place.
+#
+# The catalog and schema queries read pg_catalog directly rather than the
+# information_schema views, which are layered over pg_class/pg_attribute
+# with extensive joins, CASE expressions and permission filters and are
+# markedly slower on catalogs with thousands of objects. relkind 'r'/'p'
+# are (partitioned) tables, 'v'/'m' are (materialized) views.
+_Q_CATALOG = """
+    SELECT 't' AS kind, c.relname, c.relkind::text, NULL, NULL
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = $1
+      AND c.relkind IN ('r', 'p', 'v', 'm')
+    UNION ALL
+    SELECT 'c', c.relname, a.attname,
+           pg_catalog.format_type(a.atttypid, a.atttypmod), a.attnum
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = $1
+      AND c.relkind IN ('r', 'p', 'v', 'm')
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+    ORDER BY 1, 2, 5
+"""
+
+_Q_SCHEMAS = """
+    SELECT nspname
+    FROM pg_catalog.pg_namespace
+    WHERE pg_catalog.has_schema_privilege(oid, 'USAGE')
+"""
+
+_Q_JSONB_COLUMN_TABLE = """
+    SELECT table_name
+    FROM information_schema.columns
+    WHERE table_schema = %s
+      AND LOWER(column_name) = %s
+      AND data_type = 'jsonb'
+    LIMIT 1
+"""
+
+# The hot statements are identical across requests except for parameter
+# values; preparing them server-side skips PostgreSQL's parse/plan step on
+# every call after the first, so each pooled connection plans them once
+# per process lifetime.
+_PREPARE_STATEMENTS = f"""
+    PREPARE jl_db_comp_catalog (text) AS {_Q_CATALOG};
+    PREPARE jl_db_comp_schemas AS {_Q_SCHEMAS};
+"""
+
+_EXEC_CATALOG = "EXECUTE jl_db_comp_catalog (%s)"
+_EXEC_SCHEMAS = "EXECUTE jl_db_comp_schemas"
+
+
+def _ensure_prepared(conn) -> None:
+    """Prepare the hot completion statements once per pooled connection.
+
+    Args:
+        conn: A _CompletionsConnection checked out from a pool
+    """
+    if not conn.prepared:
+        with conn.cursor() as cursor:
+            cursor.execute(_PREPARE_STATEMENTS)
+        conn.prepared = True
+
+
+# One connection pool per normalized DSN. Completions fire on nearly every
+# keystroke, so reusing connections avoids a full PostgreSQL handshake
+# (TCP + auth + startup packet) per request.
+_POOLS: dict = {}
+_POOLS_LOCK = threading.Lock()
+
+# libpq parameters merged into every pooled connection: bound the connect
+# time so a hung server can't pin a worker indefinitely, and enable TCP
+# keepalives so connections dropped by NATs or firewalls are detected and
+# recycled instead of wedging a request. Values given in the DSN win.
+_CONNECT_DEFAULTS = {
+    "connect_timeout": 3,
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+    "application_name": "jl_db_comp",
+}
+
+
+def _pool_key(db_url: str) -> str:
+    """Build a stable pool key for a connection string.
+
+    Parses and re-serializes the DSN so that equivalent connection strings
+    (e.g. with query parameters in a different order) share one pool.
+
+    Args:
+        db_url: PostgreSQL connection string
+
+    Returns:
+        Normalized key string for the pool registry
+    """
+    try:
+        params = psycopg2.extensions.parse_dsn(db_url)
+    except psycopg2.Error:
+        # Invalid DSNs fall back to the raw string; the subsequent
+        # connection attempt will surface the real error.
+        return db_url
+    return " ".join(f"{k}={params[k]}" for k in sorted(params))
+
+
+def _get_pool(db_url: str):
+    """Get or lazily create the connection pool for a connection string.
+
+    Args:
+        db_url: PostgreSQL connection string
+
+    Returns:
+        ThreadedConnectionPool for the given DSN
+    """
+    key = _pool_key(db_url)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            try:
+                params = dict(_CONNECT_DEFAULTS,
+                              **psycopg2.extensions.parse_dsn(db_url))
+            except psycopg2.Error:
+                # Unparseable DSNs go through verbatim so connect()
+                # surfaces the real error.
+                params = {"dsn": db_url}
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                minconn=1, maxconn=8,
+                connection_factory=_CompletionsConnection,
+                **params
+            )
+            _POOLS[key] = pool
+        return pool
+
+
+def _close_pools():
+    """Close all pooled connections at interpreter shutdown."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.closeall()
+        _POOLS.clear()
+
+
+atexit.register(_close_pools)
+
+
+# Blocking psycopg2 calls run on this bounded executor so the Tornado IO
+# loop - shared with every other Jupyter server request, including kernel
+# traffic - never stalls on a slow database. The worker cap also bounds DB
+# concurrency from a single server.
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="jl_db_comp")
+
+
+# Serialized completion responses keyed by the full request shape.
+# information_schema contents change on the order of minutes, not
+# keystrokes, so a short TTL turns repeated requests into a dictionary
+# lookup with no DB round-trip or re-serialization.
+_RESPONSE_CACHE = TTLCache(maxsize=512, ttl=60)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _to_columnar(completions: dict) -> dict:
+    """Re-encode a completion payload in columnar form.
+
+    The row-oriented format repeats the key strings "name", "table",
+    "dataType" and "type" once per row; parallel arrays carry the same
+    data in a fraction of the bytes and parse proportionally faster in
+    the browser. The constant per-column "type" field is dropped - the
+    bucket itself identifies the completion kind - and each column's
+    table is dictionary-encoded: "table_id" indexes into "tables_dict"
+    rather than repeating the table name once per column. Requested by
+    clients via ?format=columnar; the row-oriented format stays the
+    default.
+
+    Args:
+        completions: Row-oriented completion payload
+
+    Returns:
+        Columnar payload with parallel arrays for tables and columns
+    """
+    tables = completions.get("tables", [])
+    columns = completions.get("columns", [])
+
+    # One pass per bucket: zip transposes the table rows at C level, and
+    # the column loop fills all three arrays plus the dictionary encoding
+    # without re-iterating the rows per field.
+    if tables:
+        table_names, table_types = zip(
+            *((t["name"], t["type"]) for t in tables)
+        )
+    else:
+        table_names = table_types = ()
+
+    table_index = {}
+    column_names = []
+    column_types = []
+    table_ids = []
+    for c in columns:
+        column_names.append(c["name"])
+        column_types.append(c["dataType"])
+        table_ids.append(table_index.setdefault(c["table"], len(table_index)))
+
+    columnar = {
+        "status": completions["status"],
+        "format": "columnar",
+        "tables": {
+            "name": table_names,
+            "type": table_types,
+        },
+        "tables_dict": list(table_index),
+        "columns": {
+            "name": column_names,
+            "table_id": table_ids,
+            "dataType": column_types,
+        },
+    }
+    # JSONB keys carry per-item key paths and stay row-oriented
+    if "jsonbKeys" in completions:
+        columnar["jsonbKeys"] = completions["jsonbKeys"]
+    if "message" in completions:
+        columnar["message"] = completions["message"]
+    return columnar
+
+
+# Fixed-shape responses, serialized once at import time so the hot paths
+# and error paths never re-encode a constant dict. Bodies that can be
+# requested as ?format=columnar exist in both encodings so the response
+# shape stays consistent even when the handler degrades gracefully.
+_PSYCOPG2_MISSING_BODY = _dumps({
+    "status": "error",
+    "message": "psycopg2 is not installed. Install with: pip install psycopg2-binary"
+})
+_NO_CONNECTION_PAYLOAD = {
+    "status": "success",
+    "tables": [],
+    "columns": [],
+    "jsonbKeys": [],
+    "message": "No connection specified. Configure a connection in connections.ini or provide connection name."
+}
+_NO_CONNECTION_BODY = _dumps(_NO_CONNECTION_PAYLOAD)
+_NO_CONNECTION_BODY_COLUMNAR = _dumps(_to_columnar(_NO_CONNECTION_PAYLOAD))
+_DIAG_NO_CONNECTION_BODY = _dumps({
+    "status": "error",
+    "message": "No connection specified. Configure a connection in connections.ini."
+})
+
+# Base shape for dynamic error responses; copied and updated with the
+# concrete message per failure.
+_ERROR_TEMPLATE = {
+    "status": "error",
+    "message": "",
+    "tables": [],
+    "columns": []
+}
+
+
+def _make_etag(body: bytes) -> str:
+    """Build a strong ETag for a serialized response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+# Bodies below this size gain little from compression and aren't worth the
+# extra allocation or the Content-Encoding header.
+_GZIP_MIN_BYTES = 1024
+
+
+def _maybe_gzip(handler: APIHandler, body: bytes) -> bytes:
+    """Gzip a response body when the client accepts it.
+
+    Completion JSON is highly redundant (repeated keys, table names and
+    data-type strings) and compresses 5-10x; compresslevel=1 captures
+    the bulk of that at roughly a third of the CPU of the default level.
+    Sets the Content-Encoding and Vary headers when compressing.
+
+    Args:
+        handler: The request handler writing the response
+        body: Serialized response bytes
+
+    Returns:
+        Compressed bytes, or the original body when compression is
+        skipped
+    """
+    if len(body) < _GZIP_MIN_BYTES:
+        return body
+    accept_encoding = handler.request.headers.get("Accept-Encoding", "")
+    if "gzip" not in accept_encoding:
+        return body
+    handler.set_header("Content-Encoding", "gzip")
+    handler.add_header("Vary", "Accept-Encoding")
+    return gzip.compress(body, compresslevel=1)
+
+
+# Full per-schema catalogs (tables plus columns grouped by table), fetched
+# without any prefix filter. Successive keystrokes narrow a prefix, so the
+# result of every longer prefix is a subset of the unfiltered list: one DB
+# hit per schema serves an entire typing session, with prefix filtering
+# done in-process.
+_CATALOG_CACHE = TTLCache(maxsize=64, ttl=60)
+_CATALOG_CACHE_LOCK = threading.Lock()
+
+
+# Upper bound on completion items per response. A 1-character prefix can
+# match thousands of columns that the UI truncates anyway, so capping the
+# lists bounds serialization cost and payload size. The catalog itself is
+# cached unfiltered; the cap applies when assembling a response.
+_MAX_ROWS = int(os.environ.get("JL_DB_COMP_MAX_ROWS", "200"))
+
+
+# Lowercased schema names per DSN. Schema lists change rarely, so a longer
+# TTL lets the schema_or_table branch resolve the ambiguous identifier in
+# pure Python instead of probing the database on every keystroke.
+_SCHEMA_SET_CACHE = TTLCache(maxsize=64, ttl=300)
+_SCHEMA_SET_CACHE_LOCK = threading.Lock()
+
 
 class PostgresCompletionsHandler(APIHandler):
     """Handler for fetching PostgreSQL table and column completions."""
 
     @tornado.web.authenticated
-    def get(self):
+    async def get(self):
         """Fetch completions from PostgreSQL database.
 
         Query parameters:
@@ -32,13 +390,12 @@ class PostgresCompletionsHandler(APIHandler):
         - schema: Database schema (default: 'public')
         - table: Optional table name to filter columns (only returns columns from this table)
         - schema_or_table: Ambiguous identifier - backend determines if it's a schema or table
+        - format: Optional response encoding; 'columnar' returns parallel arrays
+          instead of an array of objects
         """
         if not PSYCOPG2_AVAILABLE:
             self.set_status(500)
-            self.finish(json.dumps({
-                "status": "error",
-                "message": "psycopg2 is not installed. Install with: pip install psycopg2-binary"
-            }))
+            self.finish(_PSYCOPG2_MISSING_BODY)
             return
 
         try:
@@ -51,31 +408,31 @@ class PostgresCompletionsHandler(APIHandler):
             schema_or_table = self.get_argument('schema_or_table', None)
             jsonb_column = self.get_argument('jsonb_column', None)
             jsonb_path_str = self.get_argument('jsonb_path', None)
+            response_format = self.get_argument('format', None)
 
             # Priority: connection name -> db_url parameter
             if connection_name:
                 db_url = get_connection_url(connection_name, connections_file)
                 if not db_url:
                     file_info = f" (searched in: {connections_file})" if connections_file else ""
-                    self.finish(json.dumps({
+                    payload = {
                         "status": "error",
                         "tables": [],
                         "columns": [],
                         "jsonbKeys": [],
                         "message": f"Connection '{connection_name}' not found in connections.ini{file_info}"
-                    }))
+                    }
+                    if response_format == 'columnar':
+                        payload = _to_columnar(payload)
+                    self.finish(_dumps(payload))
                     return
             elif db_url:
                 db_url = unquote(db_url)
 
             if not db_url:
-                self.finish(json.dumps({
-                    "status": "success",
-                    "tables": [],
-                    "columns": [],
-                    "jsonbKeys": [],
-                    "message": "No connection specified. Configure a connection in connections.ini or provide connection name."
-                }))
+                self.finish(_NO_CONNECTION_BODY_COLUMNAR
+                            if response_format == 'columnar'
+                            else _NO_CONNECTION_BODY)
                 return
 
             # Parse JSON path if provided
@@ -86,31 +443,84 @@ class PostgresCompletionsHandler(APIHandler):
                 except json.JSONDecodeError:
                     jsonb_path = []
 
-            completions = self._fetch_completions(
+            # JSONB requests sample table data rather than catalog metadata,
+            # so only plain table/column completions are cached.
+            cache_key = None
+            if not jsonb_column:
+                cache_key = (
+                    _pool_key(db_url), schema, prefix,
+                    table or "", schema_or_table or "",
+                    response_format or "",
+                )
+                with _RESPONSE_CACHE_LOCK:
+                    cached = _RESPONSE_CACHE.get(cache_key)
+                if_none_match = self.request.headers.get("If-None-Match")
+                if cached is not None:
+                    etag, body = cached
+                    self.set_header("ETag", etag)
+                    if if_none_match == etag:
+                        self.set_status(304)
+                        self.finish()
+                    else:
+                        self.finish(_maybe_gzip(self, body))
+                    return
+
+                # Response cache miss: the catalog may still be cached, in
+                # which case the version-derived ETag can validate the
+                # client's copy with no filtering or serialization at all.
+                if if_none_match:
+                    etag = self._cached_etag(
+                        db_url, schema, prefix, table, schema_or_table,
+                        response_format
+                    )
+                    if etag is not None and if_none_match == etag:
+                        self.set_header("ETag", etag)
+                        self.set_status(304)
+                        self.finish()
+                        return
+
+            completions = await tornado.ioloop.IOLoop.current().run_in_executor(
+                _DB_EXECUTOR, self._fetch_completions,
                 db_url, schema, prefix, table, schema_or_table, jsonb_column, jsonb_path
             )
-            self.finish(json.dumps(completions))
+            if response_format == 'columnar':
+                completions = _to_columnar(completions)
+            body = _dumps(completions)
+
+            if cache_key is not None:
+                # The fetch populated the catalog caches, so the
+                # version-derived tag is available; fall back to a body
+                # hash if not.
+                etag = self._cached_etag(
+                    db_url, schema, prefix, table, schema_or_table,
+                    response_format
+                ) or _make_etag(body)
+                with _RESPONSE_CACHE_LOCK:
+                    _RESPONSE_CACHE[cache_key] = (etag, body)
+                self.set_header("ETag", etag)
+
+            self.finish(_maybe_gzip(self, body))
 
         except psycopg2.Error as e:
             error_msg = str(e).split('\n')[0]
             self.log.error(f"PostgreSQL error: {error_msg}")
-            self.set_status(500)
-            self.finish(json.dumps({
-                "status": "error",
-                "message": f"Database error: {error_msg}",
-                "tables": [],
-                "columns": []
-            }))
+            self._finish_error(f"Database error: {error_msg}")
         except Exception as e:
             error_msg = str(e)
             self.log.error(f"Completion handler error: {error_msg}")
-            self.set_status(500)
-            self.finish(json.dumps({
-                "status": "error",
-                "message": f"Server error: {error_msg}",
-                "tables": [],
-                "columns": []
-            }))
+            self._finish_error(f"Server error: {error_msg}")
+
+    def _finish_error(self, message: str) -> None:
+        """Send a 500 error response in the encoding the client asked for.
+
+        Args:
+            message: Human-readable error message for the response body
+        """
+        self.set_status(500)
+        payload = dict(_ERROR_TEMPLATE, message=message)
+        if self.get_argument('format', None) == 'columnar':
+            payload = _to_columnar(payload)
+        self.finish(_dumps(payload))
 
     def _fetch_completions(
         self,
@@ -136,128 +546,264 @@ class PostgresCompletionsHandler(APIHandler):
         Returns:
             Dictionary with tables, columns, and jsonbKeys arrays
         """
-        conn = None
-        try:
-            conn = psycopg2.connect(db_url)
-            cursor = conn.cursor()
-
-            tables = []
-            columns = []
-            jsonb_keys = []
-
-            # Handle JSONB key extraction
-            if jsonb_column:
+        tables = []
+        columns = []
+
+        # Handle JSONB key extraction - samples table data, so it always
+        # goes to the database rather than the catalog cache
+        if jsonb_column:
+            pool = _get_pool(db_url)
+            conn = pool.getconn()
+            try:
+                conn.autocommit = True
+                cursor = conn.cursor()
                 jsonb_keys = self._fetch_jsonb_keys(
                     cursor, schema, schema_or_table, jsonb_column, jsonb_path, prefix
                 )
                 cursor.close()
-                return {
-                    "status": "success",
-                    "tables": [],
-                    "columns": [],
-                    "jsonbKeys": jsonb_keys
-                }
+            finally:
+                pool.putconn(conn)
+            return {
+                "status": "success",
+                "tables": [],
+                "columns": [],
+                "jsonbKeys": jsonb_keys
+            }
+
+        # Handle schema_or_table: check if it's a schema first, then try as table
+        if schema_or_table:
+            if self._is_schema(db_url, schema_or_table):
+                # It's a schema - list tables and views from that schema
+                catalog = self._get_catalog(db_url, schema_or_table)
+                tables = [
+                    t for low, t in catalog["tables"]
+                    if low.startswith(prefix)
+                ]
+            else:
+                # Not a schema - treat as table name in the default schema
+                catalog = self._get_catalog(db_url, schema)
+                columns = [
+                    c for low, c in catalog["columns_by_table"].get(
+                        schema_or_table.lower(), [])
+                    if low.startswith(prefix)
+                ]
+
+        # If table is specified with explicit schema, list columns from that table
+        elif table:
+            catalog = self._get_catalog(db_url, schema)
+            columns = [
+                c for low, c in catalog["columns_by_table"].get(table.lower(), [])
+                if low.startswith(prefix)
+            ]
+        else:
+            # No table or schema_or_table specified - list tables and views
+            # from the default schema
+            catalog = self._get_catalog(db_url, schema)
+            tables = [
+                t for low, t in catalog["tables"]
+                if low.startswith(prefix)
+            ]
+
+        return {
+            "status": "success",
+            "tables": tables[:_MAX_ROWS],
+            "columns": columns[:_MAX_ROWS]
+        }
 
-            # Handle schema_or_table: check if it's a schema first, then try as table
-            if schema_or_table:
-                # First, check if it's a schema
-                cursor.execute("""
-                    SELECT schema_name
-                    FROM information_schema.schemata
-                    WHERE LOWER(schema_name) = %s
-                """, (schema_or_table.lower(),))
-
-                is_schema = cursor.fetchone() is not None
-
-                if is_schema:
-                    # It's a schema - fetch tables and views from that schema
-                    cursor.execute("""
-                        SELECT table_name, table_type
-                        FROM information_schema.tables
-                        WHERE table_schema = %s
-                          AND table_type IN ('BASE TABLE', 'VIEW')
-                          AND LOWER(table_name) LIKE %s
-                        ORDER BY table_name
-                    """, (schema_or_table, f"{prefix}%"))
-
-                    tables = [
-                        {
-                            "name": row[0],
-                            "type": "view" if row[1] == 'VIEW' else "table"
-                        }
-                        for row in cursor.fetchall()
-                    ]
+    def _get_catalog(self, db_url: str, schema: str) -> dict:
+        """Get the table/column catalog for a schema, fetching on a miss.
+
+        The catalog holds every table and column of the schema; callers
+        filter it by prefix in-process instead of re-querying per keystroke.
+
+        Args:
+            db_url: PostgreSQL connection string
+            schema: Database schema name
+
+        Returns:
+            Dictionary with "tables" and "columns_by_table". Both store
+            (lowercased name, completion item) pairs so prefix filtering
+            never re-lowercases names on the per-keystroke path;
+            "columns_by_table" is keyed by lowercased table name. The
+            "version" digest identifies the catalog contents for ETag
+            derivation.
+        """
+        key = (_pool_key(db_url), schema)
+        with _CATALOG_CACHE_LOCK:
+            catalog = _CATALOG_CACHE.get(key)
+        if catalog is not None:
+            return catalog
+
+        tables = []
+        columns_by_table = {}
+
+        pool = _get_pool(db_url)
+        conn = pool.getconn()
+        close_conn = False
+        try:
+            # Catalog queries are read-only; autocommit avoids a rollback
+            # round-trip when the connection is returned to the pool.
+            conn.autocommit = True
+            _ensure_prepared(conn)
+            cursor = conn.cursor()
+            cursor.execute(_EXEC_CATALOG, (schema,))
+            # Iterate the cursor instead of fetchall() so no intermediate
+            # list of row tuples is materialized alongside the catalog.
+            # The running digest gives the catalog a content-derived
+            # version that stays stable across reloads of unchanged data,
+            # so ETags built from it survive cache expiry.
+            version_hash = hashlib.blake2b(digest_size=16)
+            for row in cursor:
+                version_hash.update(repr(row).encode("utf-8"))
+                kind, table_name, col2, col3, _ordinal = row
+                if kind == 't':
+                    tables.append((table_name.lower(), {
+                        "name": table_name,
+                        "type": "view" if col2 in ('v', 'm') else "table"
+                    }))
                 else:
-                    # Not a schema - treat as table name, fetch columns from default schema
-                    cursor.execute("""
-                        SELECT table_name, column_name, data_type
-                        FROM information_schema.columns
-                        WHERE table_schema = %s
-                          AND LOWER(table_name) = %s
-                          AND LOWER(column_name) LIKE %s
-                        ORDER BY ordinal_position
-                    """, (schema, schema_or_table.lower(), f"{prefix}%"))
-
-                    columns = [
-                        {
-                            "name": row[1],
-                            "table": row[0],
-                            "dataType": row[2],
+                    columns_by_table.setdefault(table_name.lower(), []).append(
+                        (col2.lower(), {
+                            "name": col2,
+                            "table": table_name,
+                            "dataType": col3,
                             "type": "column"
-                        }
-                        for row in cursor.fetchall()
-                    ]
-
-            # If table is specified with explicit schema, fetch columns from that table
-            elif table:
-                cursor.execute("""
-                    SELECT table_name, column_name, data_type
-                    FROM information_schema.columns
-                    WHERE table_schema = %s
-                      AND LOWER(table_name) = %s
-                      AND LOWER(column_name) LIKE %s
-                    ORDER BY ordinal_position
-                """, (schema, table.lower(), f"{prefix}%"))
+                        })
+                    )
+            cursor.close()
+        except psycopg2.OperationalError:
+            # The connection went bad - close it and drop any stale
+            # catalog and schema set so the next request reconnects and
+            # refetches.
+            close_conn = True
+            with _CATALOG_CACHE_LOCK:
+                _CATALOG_CACHE.pop(key, None)
+            with _SCHEMA_SET_CACHE_LOCK:
+                _SCHEMA_SET_CACHE.pop(key[0], None)
+            raise
+        finally:
+            # Return the connection on every exit path - errors other
+            # than OperationalError (e.g. a ProgrammingError if a proxy
+            # deallocated the prepared statements) must not leak it, or
+            # maxconn failures would exhaust the pool for this DSN.
+            pool.putconn(conn, close=close_conn)
+
+        catalog = {
+            "tables": tables,
+            "columns_by_table": columns_by_table,
+            "version": version_hash.hexdigest(),
+        }
+        with _CATALOG_CACHE_LOCK:
+            _CATALOG_CACHE[key] = catalog
+        return catalog
+
+    def _cached_etag(
+        self,
+        db_url: str,
+        schema: str,
+        prefix: str,
+        table: str = None,
+        schema_or_table: str = None,
+        response_format: str = None
+    ) -> str:
+        """Derive the ETag for a completion request from cached state alone.
 
-                columns = [
-                    {
-                        "name": row[1],
-                        "table": row[0],
-                        "dataType": row[2],
-                        "type": "column"
-                    }
-                    for row in cursor.fetchall()
-                ]
+        The tag hashes the catalog's content version together with the
+        request parameters, so it is stable across catalog reloads of
+        unchanged data and changes whenever the catalog does. Because it
+        only consults the caches, callers can match If-None-Match and
+        reply 304 without filtering or serializing anything.
+
+        Args:
+            db_url: PostgreSQL connection string
+            schema: Database schema name
+            prefix: Filter prefix (case-insensitive)
+            table: Optional table name to filter columns
+            schema_or_table: Ambiguous identifier, resolved via the cached
+                schema set
+            response_format: Requested response encoding
+
+        Returns:
+            Quoted ETag string, or None when the needed cache entries are
+            not populated yet
+        """
+        dsn = _pool_key(db_url)
+        target_schema = schema
+        column_table = table
+        if schema_or_table:
+            with _SCHEMA_SET_CACHE_LOCK:
+                schemas = _SCHEMA_SET_CACHE.get(dsn)
+            if schemas is None:
+                return None
+            if schema_or_table.lower() in schemas:
+                target_schema = schema_or_table
+                column_table = None
             else:
-                # No table or schema_or_table specified - fetch tables and views from default schema
-                cursor.execute("""
-                    SELECT table_name, table_type
-                    FROM information_schema.tables
-                    WHERE table_schema = %s
-                      AND table_type IN ('BASE TABLE', 'VIEW')
-                      AND LOWER(table_name) LIKE %s
-                    ORDER BY table_name
-                """, (schema, f"{prefix}%"))
+                column_table = schema_or_table
 
-                tables = [
-                    {
-                        "name": row[0],
-                        "type": "view" if row[1] == 'VIEW' else "table"
-                    }
-                    for row in cursor.fetchall()
-                ]
+        with _CATALOG_CACHE_LOCK:
+            catalog = _CATALOG_CACHE.get((dsn, target_schema))
+        if catalog is None:
+            return None
 
-            cursor.close()
+        tag_hash = hashlib.blake2b(digest_size=16)
+        for part in (catalog["version"], target_schema, prefix,
+                     column_table or "", response_format or ""):
+            tag_hash.update(part.encode("utf-8"))
+            tag_hash.update(b"\x1f")
+        return '"' + tag_hash.hexdigest() + '"'
 
-            return {
-                "status": "success",
-                "tables": tables,
-                "columns": columns
-            }
+    def _is_schema(self, db_url: str, name: str) -> bool:
+        """Check whether a name refers to a schema in the database.
+
+        Resolved against the cached schema set, so after the first lookup
+        per DSN the check costs no database round-trip.
+
+        Args:
+            db_url: PostgreSQL connection string
+            name: Identifier to look up (case-insensitive)
+
+        Returns:
+            True if a schema with that name exists
+        """
+        return name.lower() in self._get_schema_set(db_url)
+
+    def _get_schema_set(self, db_url: str) -> frozenset:
+        """Get the lowercased schema names for a database, fetching on a miss.
+
+        Args:
+            db_url: PostgreSQL connection string
 
+        Returns:
+            Frozenset of lowercased schema names
+        """
+        key = _pool_key(db_url)
+        with _SCHEMA_SET_CACHE_LOCK:
+            schemas = _SCHEMA_SET_CACHE.get(key)
+        if schemas is not None:
+            return schemas
+
+        pool = _get_pool(db_url)
+        conn = pool.getconn()
+        close_conn = False
+        try:
+            conn.autocommit = True
+            _ensure_prepared(conn)
+            cursor = conn.cursor()
+            cursor.execute(_EXEC_SCHEMAS)
+            schemas = frozenset(row[0].lower() for row in cursor)
+            cursor.close()
+        except psycopg2.OperationalError:
+            close_conn = True
+            raise
         finally:
-            if conn:
-                conn.close()
+            # As in _get_catalog: putconn on every exit path so no error
+            # class can leak the connection.
+            pool.putconn(conn, close=close_conn)
+
+        with _SCHEMA_SET_CACHE_LOCK:
+            _SCHEMA_SET_CACHE[key] = schemas
+        return schemas
 
     def _fetch_jsonb_keys(
         self,
@@ -284,14 +830,7 @@ class PostgresCompletionsHandler(APIHandler):
         try:
             # If no table specified, find tables with this JSONB column
             if not table_name:
-                cursor.execute("""
-                    SELECT table_name
-                    FROM information_schema.columns
-                    WHERE table_schema = %s
-                      AND LOWER(column_name) = %s
-                      AND data_type = 'jsonb'
-                    LIMIT 1
-                """, (schema, jsonb_column.lower()))
+                cursor.execute(_Q_JSONB_COLUMN_TABLE, (schema, jsonb_column.lower()))
 
                 result = cursor.fetchone()
                 if not result:
@@ -367,20 +906,14 @@ class PostgresCompletionsHandler(APIHandler):
             """
 
             cursor.execute(query)
-            keys = cursor.fetchall()
 
-            if len(keys) == 0:
-                self.log.warning(
-                    f"JSONB completion: No keys found at path '{path_expr}' in "
-                    f"'{schema}.{table_name}' despite {obj_count} objects. "
-                    f"Objects may be empty {{}}."
-                )
-                return []
-
-            # Filter by prefix and format results
+            # Filter by prefix and format results in one pass over the
+            # cursor, without materializing the raw key rows first
+            total_keys = 0
             result = []
-            for row in keys:
+            for row in cursor:
                 key = row[0]
+                total_keys += 1
                 if key.lower().startswith(prefix):
                     result.append({
                         "name": key,
@@ -388,8 +921,16 @@ class PostgresCompletionsHandler(APIHandler):
                         "keyPath": (jsonb_path or []) + [key]
                     })
 
+            if total_keys == 0:
+                self.log.warning(
+                    f"JSONB completion: No keys found at path '{path_expr}' in "
+                    f"'{schema}.{table_name}' despite {obj_count} objects. "
+                    f"Objects may be empty {{}}."
+                )
+                return []
+
             self.log.info(
-                f"JSONB completion: Found {len(keys)} unique keys at '{path_expr}' "
+                f"JSONB completion: Found {total_keys} unique keys at '{path_expr}' "
                 f"in '{schema}.{table_name}' (sampled {obj_count} objects)"
             )
 
@@ -404,7 +945,7 @@ class JsonbDiagnosticsHandler(APIHandler):
     """Handler for diagnosing JSONB column issues."""
 
     @tornado.web.authenticated
-    def get(self):
+    async def get(self):
         """Get diagnostic information about JSONB columns.
 
         Query parameters:
@@ -417,10 +958,7 @@ class JsonbDiagnosticsHandler(APIHandler):
         """
         if not PSYCOPG2_AVAILABLE:
             self.set_status(500)
-            self.finish(json.dumps({
-                "status": "error",
-                "message": "psycopg2 is not installed"
-            }))
+            self.finish(_PSYCOPG2_MISSING_BODY)
             return
 
         try:
@@ -435,7 +973,7 @@ class JsonbDiagnosticsHandler(APIHandler):
             if connection_name:
                 db_url = get_connection_url(connection_name)
                 if not db_url:
-                    self.finish(json.dumps({
+                    self.finish(_dumps({
                         "status": "error",
                         "message": f"Connection '{connection_name}' not found in connections.ini"
                     }))
@@ -444,10 +982,7 @@ class JsonbDiagnosticsHandler(APIHandler):
                 db_url = unquote(db_url)
 
             if not db_url:
-                self.finish(json.dumps({
-                    "status": "error",
-                    "message": "No connection specified. Configure a connection in connections.ini."
-                }))
+                self.finish(_DIAG_NO_CONNECTION_BODY)
                 return
 
             jsonb_path = None
@@ -457,16 +992,17 @@ class JsonbDiagnosticsHandler(APIHandler):
                 except json.JSONDecodeError:
                     jsonb_path = []
 
-            diagnostics = self._get_diagnostics(
+            diagnostics = await tornado.ioloop.IOLoop.current().run_in_executor(
+                _DB_EXECUTOR, self._get_diagnostics,
                 db_url, schema, table, column, jsonb_path
             )
-            self.finish(json.dumps(diagnostics))
+            self.finish(_dumps(diagnostics))
 
         except psycopg2.Error as e:
             error_msg = str(e).split('\n')[0]
             self.log.error(f"JSONB diagnostics error: {error_msg}")
             self.set_status(500)
-            self.finish(json.dumps({
+            self.finish(_dumps({
                 "status": "error",
                 "message": f"Database error: {error_msg}"
             }))
@@ -474,7 +1010,7 @@ class JsonbDiagnosticsHandler(APIHandler):
             error_msg = str(e)
             self.log.error(f"JSONB diagnostics error: {error_msg}")
             self.set_status(500)
-            self.finish(json.dumps({
+            self.finish(_dumps({
                 "status": "error",
                 "message": f"Server error: {error_msg}"
             }))
@@ -488,9 +1024,10 @@ class JsonbDiagnosticsHandler(APIHandler):
         jsonb_path: list = None
     ) -> dict:
         """Get diagnostic information about JSONB columns."""
-        conn = None
+        pool = _get_pool(db_url)
+        conn = pool.getconn()
         try:
-            conn = psycopg2.connect(db_url)
+            conn.autocommit = True
             cursor = conn.cursor()
 
             result = {
@@ -592,8 +1129,7 @@ class JsonbDiagnosticsHandler(APIHandler):
             return result
 
         finally:
-            if conn:
-                conn.close()
+            pool.putconn(conn)
 
     def _get_recommendation(self, diag) -> str:
         """Generate a recommendation based on diagnostic data."""
@@ -644,7 +1180,7 @@ class ConnectionsHandler(APIHandler):
             connections = list_connections()
             file_path = find_connections_file()
 
-            self.finish(json.dumps({
+            self.finish(_dumps({
                 "status": "success",
                 "connections": connections,
                 "filePath": str(file_path) if file_path else None
@@ -653,7 +1189,7 @@ class ConnectionsHandler(APIHandler):
         except Exception as e:
             self.log.error(f"Error listing connections: {e}")
             self.set_status(500)
-            self.finish(json.dumps({
+            self.finish(_dumps({
                 "status": "error",
                 "message": f"Error reading connections: {str(e)}",
                 "connections": {}
@@ -3,6 +3,10 @@ import json
 import pytest
 from tornado.httpclient import HTTPClientError
 
+from jl_db_comp import routes
+
+TEST_DB_URL = "postgresql://user@localhost:5432/testdb"
+
 
 async def test_completions_no_db_url(jp_fetch):
     """Test completions endpoint without database URL returns empty results."""
@@ -47,3 +51,110 @@ async def test_completions_schema_parameter(jp_fetch):
     # Without a valid database, should return empty results
     assert isinstance(payload["tables"], list)
     assert isinstance(payload["columns"], list)
+
+
+async def test_completions_no_db_url_columnar(jp_fetch):
+    """Test the no-connection response honors the columnar format."""
+    # When - fetch completions without db_url but with format=columnar
+    response = await jp_fetch(
+        "jl-db-comp", "completions", params={"format": "columnar"}
+    )
+
+    # Then - the degraded response keeps the columnar shape
+    assert response.code == 200
+    payload = json.loads(response.body)
+    assert payload["status"] == "success"
+    assert payload["format"] == "columnar"
+    assert payload["tables"] == {"name": [], "type": []}
+    assert payload["columns"] == {"name": [], "table_id": [], "dataType": []}
+    assert payload["tables_dict"] == []
+    assert "No connection specified" in payload.get("message", "")
+
+
+def test_to_columnar_empty_payload():
+    """Test columnar encoding of an empty completion payload."""
+    columnar = routes._to_columnar(
+        {"status": "success", "tables": [], "columns": []}
+    )
+
+    assert columnar["format"] == "columnar"
+    assert list(columnar["tables"]["name"]) == []
+    assert list(columnar["tables"]["type"]) == []
+    assert columnar["tables_dict"] == []
+    assert columnar["columns"] == {"name": [], "table_id": [], "dataType": []}
+
+
+def test_to_columnar_dictionary_encodes_tables():
+    """Test columnar encoding builds parallel arrays and table indices."""
+    payload = {
+        "status": "success",
+        "tables": [
+            {"name": "orders", "type": "table"},
+            {"name": "user_view", "type": "view"},
+        ],
+        "columns": [
+            {"name": "id", "table": "orders", "dataType": "integer", "type": "column"},
+            {"name": "email", "table": "users", "dataType": "text", "type": "column"},
+            {"name": "total", "table": "orders", "dataType": "numeric", "type": "column"},
+        ],
+        "message": "ok",
+    }
+
+    columnar = routes._to_columnar(payload)
+
+    assert list(columnar["tables"]["name"]) == ["orders", "user_view"]
+    assert list(columnar["tables"]["type"]) == ["table", "view"]
+    # Each column references its table by index into tables_dict
+    assert columnar["tables_dict"] == ["orders", "users"]
+    assert columnar["columns"]["table_id"] == [0, 1, 0]
+    assert columnar["columns"]["name"] == ["id", "email", "total"]
+    assert columnar["columns"]["dataType"] == ["integer", "text", "numeric"]
+    assert columnar["message"] == "ok"
+
+
+@pytest.fixture
+def cached_catalog():
+    """Populate the catalog and schema caches for ETag derivation tests."""
+    dsn = routes._pool_key(TEST_DB_URL)
+    key = (dsn, "public")
+    routes._CATALOG_CACHE[key] = {
+        "tables": [],
+        "columns_by_table": {},
+        "version": "v1",
+    }
+    routes._SCHEMA_SET_CACHE[dsn] = frozenset({"public"})
+    yield key
+    routes._CATALOG_CACHE.pop(key, None)
+    routes._SCHEMA_SET_CACHE.pop(dsn, None)
+
+
+def test_cached_etag_cold_cache_returns_none():
+    """Test ETag derivation declines when the catalog is not cached."""
+    etag = routes.PostgresCompletionsHandler._cached_etag(
+        None, "postgresql://user@localhost:5432/otherdb", "public", "pre"
+    )
+
+    assert etag is None
+
+
+def test_cached_etag_stable_and_version_sensitive(cached_catalog):
+    """Test ETags are stable per request shape and track the catalog version."""
+    handler = routes.PostgresCompletionsHandler
+
+    first = handler._cached_etag(None, TEST_DB_URL, "public", "pre")
+    second = handler._cached_etag(None, TEST_DB_URL, "public", "pre")
+
+    # Same request shape and catalog version -> same strong ETag
+    assert first is not None
+    assert first.startswith('"') and first.endswith('"')
+    assert first == second
+
+    # Different request parameters -> different ETag
+    assert handler._cached_etag(None, TEST_DB_URL, "public", "prefix") != first
+    assert handler._cached_etag(
+        None, TEST_DB_URL, "public", "pre", response_format="columnar"
+    ) != first
+
+    # A new catalog version invalidates previously issued ETags
+    routes._CATALOG_CACHE[cached_catalog]["version"] = "v2"
+    assert handler._cached_etag(None, TEST_DB_URL, "public", "pre") != first